@@ -1,36 +1,111 @@
-import json
+import asyncio
 import random
 import re
 import time
+import unicodedata
+from functools import cached_property
 from json import JSONDecodeError
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import openai
-from openai.error import RateLimitError, ServiceUnavailableError
-from thefuzz import fuzz
+import orjson
+from openai.error import (
+    APIConnectionError,
+    OpenAIError,
+    RateLimitError,
+    ServiceUnavailableError,
+    Timeout,
+)
+from rapidfuzz import fuzz, process
 
 from distractors_generator.constants import (
+    BATCH_DISTRACTORS_PROMPT_TEMPLATE,
     DISTRACTORS_PROMPT_TEMPLATE,
     DUPLICATES_THRESHOLD,
+    MAX_RESPONSE_TOKENS,
     MODEL_NAME,
 )
-from distractors_generator.tokens_counter import token_counter
+from distractors_generator.rate_limiter import RateLimiter
+from distractors_generator.tokens_counter import tokenizer
+
+
+class _JSONPayloadScanner:
+    """
+    Incremental scanner that finds the first balanced json object or array
+    in a stream of text chunks, ignoring brackets inside string literals.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> Optional[int]:
+        """
+        Consume the next chunk of text.
+
+        Args:
+            text (str): next chunk of the stream
+
+        Returns:
+            Optional[int]: index just past the end of the payload if it
+                completed within this chunk, None otherwise
+        """
+        for index, char in enumerate(text):
+            if self._escaped:
+                self._escaped = False
+            elif self._in_string:
+                if char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                self._started = True
+            elif char in "}]":
+                self._depth -= 1
+                if self._started and self._depth == 0:
+                    return index + 1
+        return None
 
 
 class DistractorGenerator:
     def __init__(self, model: str = MODEL_NAME):
         self._system_prompt = DISTRACTORS_PROMPT_TEMPLATE
+        self._batch_system_prompt = BATCH_DISTRACTORS_PROMPT_TEMPLATE
         self._model = model
+        self._rate_limiter = RateLimiter()
+        # Generation cache: normalized input -> longest generated list so far
+        self._cache: Dict[Tuple[str, str, str, str], List[str]] = {}
+        # Tokenize the (constant) system prompt once; backends with prefix
+        # caching can consume these ids directly
+        self._prompt_token_ids = tokenizer(self._system_prompt, self._model)
 
     @property
+    def prompt_token_ids(self) -> List[int]:
+        """
+        Get the token ids of the system prompt.
+
+        Returns:
+            List[int]: token ids of the system prompt
+        """
+        return self._prompt_token_ids
+
+    @cached_property
     def tokens_count(self) -> int:
         """
         Get the number of tokens in the system prompt.
 
+        The prompt never changes at runtime, so it is tokenized once at init.
+
         Returns:
             int: number of tokens
         """
-        return token_counter(self._system_prompt, self._model)
+        return len(self._prompt_token_ids)
 
     def _is_duplicate(
         self, a: str, b: str, threshold: int = DUPLICATES_THRESHOLD
@@ -41,12 +116,12 @@ class DistractorGenerator:
         Args:
             a (str): first string
             b (str): second string
-            threshold (int, optional): threshold for thefuzz partial ratio. Defaults to DUPLICATES_THRESHOLD.
+            threshold (int, optional): threshold for rapidfuzz partial ratio. Defaults to DUPLICATES_THRESHOLD.
 
         Returns:
             bool: True if strings are duplicates, False otherwise
         """
-        return fuzz.partial_ratio(a, b) > threshold
+        return fuzz.partial_ratio(a, b, score_cutoff=threshold) > threshold
 
     def _drop_duplicates(
         self, distractors: List[str], threshold: int = DUPLICATES_THRESHOLD
@@ -58,75 +133,308 @@ class DistractorGenerator:
 
         Args:
             distractors (List[str]): list of distractors
-            threshold (int, optional): threshold for thefuzz partial ratio. Defaults to DUPLICATES_THRESHOLD.
+            threshold (int, optional): threshold for rapidfuzz partial ratio. Defaults to DUPLICATES_THRESHOLD.
 
         Returns:
             1. List[str]: list of unique distractors
             2. List[str]: list of found duplicates
         """
-        duplicates, unique = [], []
-        for i, distractor in enumerate(distractors):
-            for j, distractor2 in enumerate(distractors):
-                if i != j and self._is_duplicate(distractor, distractor2, threshold):
-                    duplicates.append(distractor2)
-                    break
+        # Collapse exact repeats (after unicode/case/whitespace normalization)
+        # with O(N) hash lookups before any fuzzy scoring
+        seen = {}
+        exact_duplicates = []
+        for distractor in distractors:
+            key = unicodedata.normalize("NFKC", distractor).strip().casefold()
+            if key in seen:
+                exact_duplicates.append(distractor)
             else:
-                unique.append(distractor)
+                seen[key] = distractor
+        distractors = list(seen.values())
+
+        if len(distractors) < 2:
+            return distractors, exact_duplicates
+
+        # For a handful of strings the plain loop beats the setup cost of
+        # blocking and the score matrix
+        if len(distractors) <= 3:
+            duplicates, unique = [], []
+            for i, distractor in enumerate(distractors):
+                if any(
+                    i != j and self._is_duplicate(distractor, other, threshold)
+                    for j, other in enumerate(distractors)
+                ):
+                    duplicates.append(distractor)
+                else:
+                    unique.append(distractor)
+            return unique, duplicates + exact_duplicates
+
+        # Pairwise score matrix computed in C with multi-threading
+        scores = process.cdist(
+            distractors,
+            distractors,
+            scorer=fuzz.partial_ratio,
+            score_cutoff=threshold,
+            workers=-1,
+        )
+
+        # Ignore self-matches on the diagonal
+        np.fill_diagonal(scores, 0)
+
+        # A distractor is a duplicate if it (almost) matches any other one
+        dup_mask = (scores > threshold).any(axis=1)
+
+        unique = [dis for dis, is_dup in zip(distractors, dup_mask) if not is_dup]
+        duplicates = [dis for dis, is_dup in zip(distractors, dup_mask) if is_dup]
+
+        return unique, duplicates + exact_duplicates
+
+    def _retry_wait_time(self, attempt: int, error: OpenAIError) -> float:
+        """
+        Compute the backoff time before the next retry.
+
+        Exponential in the attempt index, capped at 60 seconds, with random
+        jitter to avoid thundering-herd retries from concurrent callers.
+        The Retry-After header is honored if it asks for a longer wait.
+
+        Args:
+            attempt (int): zero-based index of the failed attempt
+            error (OpenAIError): the error returned by the API
+
+        Returns:
+            float: number of seconds to wait
+        """
+        wait_time = min(60, 2**attempt) + random.uniform(0, 1)
+        retry_after = float(error.headers.get("Retry-After", 0))
+        return max(wait_time, retry_after)
+
+    def _read_stream(self, stream) -> str:
+        """
+        Accumulate streamed completion chunks into the response content.
+
+        The stream is closed as soon as the json payload is balanced, so we
+        don't wait for (or pay attention to) any trailing tokens.
+
+        Args:
+            stream: chunk iterator returned by the OpenAI API
+
+        Returns:
+            str: accumulated response content
+        """
+        scanner = _JSONPayloadScanner()
+        parts = []
+        for chunk in stream:
+            delta = chunk["choices"][0]["delta"].get("content")
+            if not delta:
+                continue
+
+            payload_end = scanner.feed(delta)
+            if payload_end is not None:
+                parts.append(delta[:payload_end])
+                stream.close()
+                break
 
-        return unique, duplicates
+            parts.append(delta)
+
+        return "".join(parts)
+
+    async def _aread_stream(self, stream) -> str:
+        """
+        Async version of `_read_stream`.
+
+        Args:
+            stream: async chunk iterator returned by the OpenAI API
+
+        Returns:
+            str: accumulated response content
+        """
+        scanner = _JSONPayloadScanner()
+        parts = []
+        async for chunk in stream:
+            delta = chunk["choices"][0]["delta"].get("content")
+            if not delta:
+                continue
+
+            payload_end = scanner.feed(delta)
+            if payload_end is not None:
+                parts.append(delta[:payload_end])
+                await stream.aclose()
+                break
+
+            parts.append(delta)
+
+        return "".join(parts)
 
     def _safe_generate(
         self,
         message_history: List[Dict[str, str]],
         temperature: float = 0.8,
         num_trials: int = 3,
-    ) -> Optional[Dict]:
+        expect_list: bool = False,
+    ) -> Dict:
         """
         Safely generate and parse response from OpenAI API.
 
+        Retryable API errors are retried with exponential backoff and jitter.
+
         Args:
             message_history (List[Dict[str, str]]): message history
             temperature (float, optional): temperature for OpenAI API. Defaults to 0.8.
             num_trials (int, optional): number of unsuccessful trials. Defaults to 3.
+            expect_list (bool, optional): whether the response payload is expected
+                to be a json array. Defaults to False.
 
         Returns:
-            Optional[Dict]: Parsed OpenAI API response (None if unsuccessful trials > num_trials)
+            Dict: Parsed OpenAI API response
+
+        Raises:
+            JSONDecodeError, OpenAIError: the last error after num_trials failed attempts
         """
-        for _ in range(num_trials):
+        last_error = None
+        for attempt in range(num_trials):
             try:
-                response = openai.ChatCompletion.create(
+                stream = openai.ChatCompletion.create(
                     model=self._model,
                     messages=message_history,
                     temperature=temperature,
-                )["choices"][0]["message"]["content"]
-                return self._parse_output_json(response)
+                    stream=True,
+                )
+                return self._parse_output_json(
+                    self._read_stream(stream), expect_list=expect_list
+                )
 
             except JSONDecodeError as e:
+                last_error = e
                 print(e)
                 continue
 
-            except (RateLimitError, ServiceUnavailableError) as e:
-                wait_time = e.headers.get("Retry-After", 20)
-                print(f"Rate limit exceeded, waiting for {wait_time} seconds")
+            except (
+                RateLimitError,
+                ServiceUnavailableError,
+                APIConnectionError,
+                Timeout,
+            ) as e:
+                last_error = e
+                wait_time = self._retry_wait_time(attempt, e)
+                print(f"API error: {e}, waiting for {wait_time:.1f} seconds")
                 time.sleep(wait_time)
                 continue
 
-        return None
+        raise last_error
+
+    async def _asafe_generate(
+        self,
+        message_history: List[Dict[str, str]],
+        temperature: float = 0.8,
+        num_trials: int = 3,
+        expect_list: bool = False,
+    ) -> Dict:
+        """
+        Async version of `_safe_generate`.
+
+        Args:
+            message_history (List[Dict[str, str]]): message history
+            temperature (float, optional): temperature for OpenAI API. Defaults to 0.8.
+            num_trials (int, optional): number of unsuccessful trials. Defaults to 3.
+            expect_list (bool, optional): whether the response payload is expected
+                to be a json array. Defaults to False.
+
+        Returns:
+            Dict: Parsed OpenAI API response
+
+        Raises:
+            JSONDecodeError, OpenAIError: the last error after num_trials failed attempts
+        """
+        last_error = None
+        for attempt in range(num_trials):
+            try:
+                # Reserve our request/token budget before hitting the API
+                await self._rate_limiter.acquire(
+                    tokens=self.tokens_count + MAX_RESPONSE_TOKENS
+                )
+                stream = await openai.ChatCompletion.acreate(
+                    model=self._model,
+                    messages=message_history,
+                    temperature=temperature,
+                    stream=True,
+                )
+                return self._parse_output_json(
+                    await self._aread_stream(stream), expect_list=expect_list
+                )
+
+            except JSONDecodeError as e:
+                last_error = e
+                print(e)
+                continue
 
-    def _parse_output_json(self, response: str) -> Dict:
+            except (
+                RateLimitError,
+                ServiceUnavailableError,
+                APIConnectionError,
+                Timeout,
+            ) as e:
+                last_error = e
+                wait_time = self._retry_wait_time(attempt, e)
+                print(f"API error: {e}, waiting for {wait_time:.1f} seconds")
+                await asyncio.sleep(wait_time)
+                continue
+
+        raise last_error
+
+    def _parse_output_json(self, response: str, expect_list: bool = False) -> Dict:
         """
         Parse response from OpenAI API.
 
+        The payload is either a single json object or (for batch requests)
+        a json array of objects. The expected bracket type is tried first,
+        so a bracketed aside in a preamble (e.g. "Here are [3]
+        distractors: {...}") doesn't shadow the real payload.
+
         Args:
             response (str): response from OpenAI API
+            expect_list (bool, optional): whether the payload is expected to
+                be a json array. Defaults to False.
 
         Returns:
             Dict: parsed response
         """
-        try:
-            return json.loads(response)
-        except JSONDecodeError:
-            return json.loads(response[response.find("{") : response.find("}") + 1])
+        brackets = "[{" if expect_list else "{["
+        for bracket in brackets:
+            payload = self._extract_json(response, bracket)
+            if payload is None:
+                continue
+            try:
+                return orjson.loads(payload)
+            except JSONDecodeError:
+                continue
+
+        # No candidate parsed; let the parser raise on the raw response
+        return orjson.loads(response)
+
+    def _extract_json(self, response: str, bracket: str) -> Optional[str]:
+        """
+        Extract the first balanced json payload opened by `bracket`.
+
+        Unlike naive find()-based slicing this handles nested braces and
+        brackets, as well as braces inside string values.
+
+        Args:
+            response (str): raw response text
+            bracket (str): the opening bracket of the payload, "{" or "["
+
+        Returns:
+            Optional[str]: the json payload substring, or None if no
+                balanced payload starting with `bracket` is found
+        """
+        start = response.find(bracket)
+        if start == -1:
+            return None
+
+        scanner = _JSONPayloadScanner()
+        end = scanner.feed(response[start:])
+        if end is None:
+            return None
+
+        return response[start : start + end]
 
     def _parse_distractors_dict(self, distractors_dict: Dict) -> List[str]:
         """
@@ -169,13 +477,13 @@ class DistractorGenerator:
             return distractors
 
         for _ in range(num_trials):
-            # Infer model and get response
-            distractors_dict = self._safe_generate(
-                message_history, temperature=temperature
-            )
-
-            # Check if we have response
-            if distractors_dict is None:
+            # Infer model and get response; these trials are best-effort,
+            # so a failed one should not abort the whole generation
+            try:
+                distractors_dict = self._safe_generate(
+                    message_history, temperature=temperature
+                )
+            except (JSONDecodeError, OpenAIError):
                 continue
 
             # Parse response to list of distractors
@@ -194,6 +502,228 @@ class DistractorGenerator:
 
         return distractors
 
+    async def _agenerate_unique_distractors_batch(
+        self,
+        message_history: List[Dict[str, str]],
+        distractors: List[str],
+        expected_count: int,
+        num_trials: int = 1,
+        temperature: float = 1.2,
+    ) -> List[str]:
+        """
+        Async version of `_generate_unique_distractors_batch`.
+
+        All trials are fired concurrently and consumed in completion order,
+        so the latency is one round trip whenever a single trial suffices;
+        trials that are no longer needed get cancelled.
+
+        Args:
+            message_history (List[Dict[str, str]]): prompt for OpenAI API
+            distractors (List[str]): list of distractors
+            expected_count (int): expected number of distractors
+            num_trials (int, optional): number of generation trials. Defaults to 1.
+            temperature (float, optional): temperature for OpenAI API. Defaults to 1.2.
+
+        Returns:
+            List[str]: list of unique distractors
+        """
+        # Quick check if we have enough distractors
+        if len(distractors) >= expected_count:
+            return distractors
+
+        # We can't generate any new distractors if we have no trials
+        if num_trials == 0:
+            return distractors
+
+        tasks = [
+            asyncio.create_task(
+                self._asafe_generate(message_history, temperature=temperature)
+            )
+            for _ in range(num_trials)
+        ]
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                # These trials are best-effort, so a failed one should not
+                # abort the whole generation
+                try:
+                    distractors_dict = await future
+                except (JSONDecodeError, OpenAIError):
+                    continue
+
+                # Parse response to list of distractors
+                distractors_new = self._parse_distractors_dict(distractors_dict)
+
+                # Check if we have new unique distractors
+                for new_dis in distractors_new:
+                    is_duplicate = any(
+                        [self._is_duplicate(new_dis, dis) for dis in distractors]
+                    )
+                    if not is_duplicate:
+                        distractors.append(new_dis)
+
+                if len(distractors) >= expected_count:
+                    break
+        finally:
+            # Don't keep paying for trials we no longer need
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return distractors
+
+    def _cache_key(
+        self,
+        word: str,
+        translation: str,
+        source_language: str,
+        target_language: str,
+    ) -> Tuple[str, str, str, str]:
+        """
+        Build a normalized cache key for a generation request.
+
+        The requested count is deliberately not part of the key: a cached
+        result with enough items can serve any smaller count by truncation.
+
+        Args:
+            word (str): The word in source language.
+            translation (str): The translation of the word in target language.
+            source_language (str): The source language.
+            target_language (str): The target language.
+
+        Returns:
+            Tuple[str, str, str, str]: normalized cache key
+        """
+        return (word.lower(), translation.lower(), source_language, target_language)
+
+    def _cache_put(
+        self, cache_key: Tuple[str, str, str, str], distractors: List[str]
+    ) -> None:
+        """
+        Store a generated list, keeping the longest known result per key.
+
+        Args:
+            cache_key (Tuple[str, str, str, str]): normalized cache key
+            distractors (List[str]): generated distractors
+        """
+        cached = self._cache.get(cache_key)
+        if cached is None or len(distractors) > len(cached):
+            self._cache[cache_key] = distractors
+
+    def _build_message_history(
+        self,
+        word: str,
+        translation: str,
+        source_language: str,
+        target_language: str,
+        count: int,
+    ) -> List[Dict[str, str]]:
+        """
+        Build the message history for a single generation request.
+
+        Args:
+            word (str): The word in source language.
+            translation (str): The translation of the word in target language.
+            source_language (str): The source language.
+            target_language (str): The target language.
+            count (int): The number of distractors to generate.
+
+        Returns:
+            List[Dict[str, str]]: message history for the OpenAI API
+        """
+        # Create input dict
+        input_dict = {
+            "word": word,
+            "translation": translation,
+            "source_language": source_language,
+            "target_language": target_language,
+            "num_distractors": count,
+        }
+
+        # Dump input dict to json string
+        input_json = orjson.dumps(input_dict).decode()
+
+        # The system prompt is byte-identical across calls, so the server
+        # side can cache its prefill across requests
+        return [
+            {"role": "system", "content": self._system_prompt},
+            {"role": "user", "content": input_json},
+        ]
+
+    def _build_batch_message_history(
+        self, items: List[Dict[str, str]], count: int
+    ) -> List[Dict[str, str]]:
+        """
+        Build the message history for a batched generation request.
+
+        Args:
+            items (List[Dict[str, str]]): dicts with "word", "translation",
+                "source_language" and "target_language" keys
+            count (int): The number of distractors to generate per word.
+
+        Returns:
+            List[Dict[str, str]]: message history for the OpenAI API
+        """
+        # Pack all items into a single input array
+        input_list = [
+            {
+                "word": item["word"],
+                "translation": item["translation"],
+                "source_language": item["source_language"],
+                "target_language": item["target_language"],
+                "num_distractors": count,
+            }
+            for item in items
+        ]
+
+        return [
+            {"role": "system", "content": self._batch_system_prompt},
+            {"role": "user", "content": orjson.dumps(input_list).decode()},
+        ]
+
+    def _clean_distractors(
+        self, distractors: List[str], translation: str
+    ) -> List[str]:
+        """
+        Remove the right translation and trailing parentheses from distractors.
+
+        Args:
+            distractors (List[str]): list of distractors
+            translation (str): the right translation of the word
+
+        Returns:
+            List[str]: cleaned list of distractors
+        """
+        # Remove translation from distractors list (if it exists)
+        distractors = [dis for dis in distractors if dis != translation]
+
+        # Remove parentheses
+        return [re.sub(r"\s*\(.*\)", "", string) for string in distractors]
+
+    def _finalize_distractors(
+        self, distractors: List[str], duplicates: List[str], count: int
+    ) -> List[str]:
+        """
+        Pad the distractors list from duplicates and truncate it to `count` items.
+
+        Args:
+            distractors (List[str]): list of unique distractors
+            duplicates (List[str]): list of found duplicates
+            count (int): the number of distractors to return
+
+        Returns:
+            List[str]: final list of distractors
+        """
+        # If we still don't have enough distractors, just sample from duplicates
+        if len(distractors) < count:
+            distractors += random.sample(duplicates, count - len(distractors))
+
+        # If we have too many distractors, truncate
+        if len(distractors) > count:
+            distractors = distractors[:count]
+
+        return distractors
+
     def generate(
         self,
         word: str,
@@ -219,27 +749,15 @@ class DistractorGenerator:
         Returns:
             List[str]: A list of generated distractors for the word.
         """
-        # Create input dict
-        input_dict = {
-            "word": word,
-            "translation": translation,
-            "source_language": source_language,
-            "target_language": target_language,
-            "num_distractors": count,
-        }
+        # Serve repeated inputs from the cache instead of re-hitting the API
+        cache_key = self._cache_key(word, translation, source_language, target_language)
+        cached = self._cache.get(cache_key)
+        if cached is not None and len(cached) >= count:
+            return cached[:count]
 
-        # Dump input dict to json string
-        input_json = json.dumps(input_dict)
-
-        # Add input json to self._prompt
-        message_history = [
-            {"role": "user", "content": self._system_prompt},
-            {
-                "role": "assistant",
-                "content": "Ready to generate distractors. Waiting for input...",
-            },
-            {"role": "user", "content": input_json},
-        ]
+        message_history = self._build_message_history(
+            word, translation, source_language, target_language, count
+        )
 
         # Infer model and get response
         distractors_dict = self._safe_generate(message_history)
@@ -247,30 +765,267 @@ class DistractorGenerator:
         # Parse response to list of distractors
         distractors = self._parse_distractors_dict(distractors_dict)
 
-        # Remove translation from distractors list (if it exists)
-        distractors = [dis for dis in distractors if dis != translation]
-
-        # Remove parentheses
-        distractors = [re.sub(r"\s*\(.*\)", "", string) for string in distractors]
+        # Remove the right translation and parentheses
+        distractors = self._clean_distractors(distractors, translation)
 
         # Remove duplicates from distractors list
         distractors, duplicates = self._drop_duplicates(distractors)
 
-        # If we have duplicates, we need to generate new distractors
-        distractors = self._generate_unique_distractors_batch(
-            message_history=message_history,
-            distractors=distractors,
-            expected_count=count,
-            num_trials=deduplicate_num_trials,
-            temperature=deduplicate_temperature,
+        # Only pay for extra generation trials if we're short on uniques
+        if len(distractors) < count:
+            distractors = self._generate_unique_distractors_batch(
+                message_history=message_history,
+                distractors=distractors,
+                expected_count=count,
+                num_trials=deduplicate_num_trials,
+                temperature=deduplicate_temperature,
+            )
+
+        distractors = self._finalize_distractors(distractors, duplicates, count)
+        # Cache a copy so callers mutating the returned list can't corrupt
+        # later cache hits
+        self._cache_put(cache_key, list(distractors))
+        return distractors
+
+    async def agenerate(
+        self,
+        word: str,
+        translation: str,
+        source_language: str = "en",
+        target_language: str = "ru",
+        count: int = 3,
+        deduplicate_num_trials: int = 1,
+        deduplicate_temperature: float = 1.2,
+    ) -> List[str]:
+        """
+        Async version of `generate` for running many requests concurrently.
+
+        Args:
+            word (str): The word in source language.
+            translation (str): The translation of the word in target language.
+            source_language (str, optional): The source language (default is "en").
+            target_language (str, optional): The target language (default is "ru").
+            count (int, optional): The number of distractors to generate (default is 3).
+            deduplicate_num_trials (int, optional): The number of trials to deduplicate distractors
+                (default is 1).
+            deduplicate_temperature (float, optional): The temperature for deduplication trials
+                (default is 1.2)
+        Returns:
+            List[str]: A list of generated distractors for the word.
+        """
+        # Serve repeated inputs from the cache instead of re-hitting the API
+        cache_key = self._cache_key(word, translation, source_language, target_language)
+        cached = self._cache.get(cache_key)
+        if cached is not None and len(cached) >= count:
+            return cached[:count]
+
+        message_history = self._build_message_history(
+            word, translation, source_language, target_language, count
         )
 
-        # If we still don't have enough distractors, just sample from duplicates
-        if len(distractors) < count:
-            distractors += random.sample(duplicates, count - len(distractors))
+        # Infer model and get response
+        distractors_dict = await self._asafe_generate(message_history)
 
-        # If we have too many distractors, truncate
-        if len(distractors) > count:
-            distractors = distractors[:count]
+        # Parse response to list of distractors
+        distractors = self._parse_distractors_dict(distractors_dict)
+
+        # Remove the right translation and parentheses
+        distractors = self._clean_distractors(distractors, translation)
 
+        # Remove duplicates from distractors list
+        distractors, duplicates = self._drop_duplicates(distractors)
+
+        # Only pay for extra generation trials if we're short on uniques
+        if len(distractors) < count:
+            distractors = await self._agenerate_unique_distractors_batch(
+                message_history=message_history,
+                distractors=distractors,
+                expected_count=count,
+                num_trials=deduplicate_num_trials,
+                temperature=deduplicate_temperature,
+            )
+
+        distractors = self._finalize_distractors(distractors, duplicates, count)
+        # Cache a copy so callers mutating the returned list can't corrupt
+        # later cache hits
+        self._cache_put(cache_key, list(distractors))
         return distractors
+
+    def _postprocess_batch_item(
+        self,
+        item: Dict[str, str],
+        distractors_dict: Dict,
+        count: int,
+        deduplicate_num_trials: int,
+        deduplicate_temperature: float,
+    ) -> List[str]:
+        """
+        Clean, deduplicate and finalize one item of a batch response.
+
+        Args:
+            item (Dict[str, str]): the input item the response belongs to
+            distractors_dict (Dict): the model output for this item
+            count (int): the number of distractors to return
+            deduplicate_num_trials (int): number of trials to deduplicate distractors
+            deduplicate_temperature (float): temperature for deduplication trials
+
+        Returns:
+            List[str]: final list of distractors for the item
+        """
+        distractors = self._parse_distractors_dict(distractors_dict)
+        distractors = self._clean_distractors(distractors, item["translation"])
+        distractors, duplicates = self._drop_duplicates(distractors)
+
+        # Only pay for extra generation trials if we're short on uniques;
+        # retries go through the cheaper single-item prompt
+        if len(distractors) < count:
+            message_history = self._build_message_history(
+                item["word"],
+                item["translation"],
+                item["source_language"],
+                item["target_language"],
+                count,
+            )
+            distractors = self._generate_unique_distractors_batch(
+                message_history=message_history,
+                distractors=distractors,
+                expected_count=count,
+                num_trials=deduplicate_num_trials,
+                temperature=deduplicate_temperature,
+            )
+
+        return self._finalize_distractors(distractors, duplicates, count)
+
+    def generate_batch(
+        self,
+        items: List[Dict[str, str]],
+        count: int = 3,
+        deduplicate_num_trials: int = 1,
+        deduplicate_temperature: float = 1.2,
+    ) -> List[List[str]]:
+        """
+        Generate distractors for several words with a single API call.
+
+        Packing multiple words into one request amortizes the prompt prefill
+        and the per-request rate limit cost over the whole batch. If the
+        batched response cannot be parsed into one result per item, the
+        method falls back to one `generate` call per item.
+
+        Args:
+            items (List[Dict[str, str]]): dicts with "word", "translation",
+                "source_language" and "target_language" keys
+            count (int, optional): The number of distractors per word (default is 3).
+            deduplicate_num_trials (int, optional): The number of trials to deduplicate
+                distractors (default is 1).
+            deduplicate_temperature (float, optional): The temperature for deduplication
+                trials (default is 1.2)
+
+        Returns:
+            List[List[str]]: one list of distractors per input item, in input order
+        """
+        message_history = self._build_batch_message_history(items, count)
+
+        # Infer model and get response
+        try:
+            parsed = self._safe_generate(message_history, expect_list=True)
+        except JSONDecodeError:
+            parsed = None
+
+        # Fall back to per-item generation on unusable batch output
+        if not isinstance(parsed, list) or len(parsed) != len(items):
+            return [
+                self.generate(
+                    word=item["word"],
+                    translation=item["translation"],
+                    source_language=item["source_language"],
+                    target_language=item["target_language"],
+                    count=count,
+                    deduplicate_num_trials=deduplicate_num_trials,
+                    deduplicate_temperature=deduplicate_temperature,
+                )
+                for item in items
+            ]
+
+        return [
+            self._postprocess_batch_item(
+                item, distractors_dict, count, deduplicate_num_trials, deduplicate_temperature
+            )
+            for item, distractors_dict in zip(items, parsed)
+        ]
+
+    async def agenerate_batch(
+        self,
+        items: List[Dict[str, str]],
+        count: int = 3,
+        deduplicate_num_trials: int = 1,
+        deduplicate_temperature: float = 1.2,
+    ) -> List[List[str]]:
+        """
+        Async version of `generate_batch`.
+
+        Args:
+            items (List[Dict[str, str]]): dicts with "word", "translation",
+                "source_language" and "target_language" keys
+            count (int, optional): The number of distractors per word (default is 3).
+            deduplicate_num_trials (int, optional): The number of trials to deduplicate
+                distractors (default is 1).
+            deduplicate_temperature (float, optional): The temperature for deduplication
+                trials (default is 1.2)
+
+        Returns:
+            List[List[str]]: one list of distractors per input item, in input order
+        """
+        message_history = self._build_batch_message_history(items, count)
+
+        # Infer model and get response
+        try:
+            parsed = await self._asafe_generate(message_history, expect_list=True)
+        except JSONDecodeError:
+            parsed = None
+
+        # Fall back to per-item generation on unusable batch output
+        if not isinstance(parsed, list) or len(parsed) != len(items):
+            return list(
+                await asyncio.gather(
+                    *[
+                        self.agenerate(
+                            word=item["word"],
+                            translation=item["translation"],
+                            source_language=item["source_language"],
+                            target_language=item["target_language"],
+                            count=count,
+                            deduplicate_num_trials=deduplicate_num_trials,
+                            deduplicate_temperature=deduplicate_temperature,
+                        )
+                        for item in items
+                    ]
+                )
+            )
+
+        results = []
+        for item, distractors_dict in zip(items, parsed):
+            distractors = self._parse_distractors_dict(distractors_dict)
+            distractors = self._clean_distractors(distractors, item["translation"])
+            distractors, duplicates = self._drop_duplicates(distractors)
+
+            # Only pay for extra generation trials if we're short on uniques;
+            # retries go through the cheaper single-item prompt
+            if len(distractors) < count:
+                single_history = self._build_message_history(
+                    item["word"],
+                    item["translation"],
+                    item["source_language"],
+                    item["target_language"],
+                    count,
+                )
+                distractors = await self._agenerate_unique_distractors_batch(
+                    message_history=single_history,
+                    distractors=distractors,
+                    expected_count=count,
+                    num_trials=deduplicate_num_trials,
+                    temperature=deduplicate_temperature,
+                )
+
+            results.append(self._finalize_distractors(distractors, duplicates, count))
+
+        return results
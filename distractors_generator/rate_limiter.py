@@ -0,0 +1,84 @@
+import asyncio
+import os
+import time
+
+# Default OpenAI rate limits for gpt-3.5-turbo (pay-as-you-go tier)
+DEFAULT_REQUESTS_PER_MINUTE = 3500
+DEFAULT_TOKENS_PER_MINUTE = 90000
+
+
+class RateLimiter:
+    """
+    Proactive request and token bucket for the OpenAI API.
+
+    Instead of firing requests until the API answers with a RateLimitError
+    (wasting a full round trip per rejected request), callers reserve their
+    request/token budget locally via `acquire` and wait until the buckets
+    refill. Buckets refill continuously at the configured per-minute rates.
+
+    Limits can be overridden with the `OPENAI_MAX_REQUESTS_PER_MINUTE` and
+    `OPENAI_MAX_TOKENS_PER_MINUTE` environment variables.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = None,
+        tokens_per_minute: float = None,
+    ):
+        if requests_per_minute is None:
+            requests_per_minute = float(
+                os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE)
+            )
+        if tokens_per_minute is None:
+            tokens_per_minute = float(
+                os.getenv("OPENAI_MAX_TOKENS_PER_MINUTE", DEFAULT_TOKENS_PER_MINUTE)
+            )
+
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._available_requests = requests_per_minute
+        self._available_tokens = tokens_per_minute
+        self._last_update_time = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """
+        Top up both buckets with the budget accumulated since the last update.
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_update_time
+        self._last_update_time = now
+
+        self._available_requests = min(
+            self._requests_per_minute,
+            self._available_requests + elapsed * self._requests_per_minute / 60,
+        )
+        self._available_tokens = min(
+            self._tokens_per_minute,
+            self._available_tokens + elapsed * self._tokens_per_minute / 60,
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Reserve one request and `tokens` tokens, waiting for refill if needed.
+
+        Args:
+            tokens (int): estimated number of tokens the request will consume
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+
+                if self._available_requests >= 1 and self._available_tokens >= tokens:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+
+                # Wait exactly as long as the refill of the missing budget takes
+                wait_time = max(
+                    (1 - self._available_requests)
+                    / (self._requests_per_minute / 60),
+                    (tokens - self._available_tokens)
+                    / (self._tokens_per_minute / 60),
+                )
+                await asyncio.sleep(wait_time)
@@ -1,12 +1,14 @@
 import argparse
-import json
+import asyncio
 import logging
 import time
 from pathlib import Path
+from typing import Dict, List, TextIO
 
 import numpy as np
+import orjson
 import pandas as pd
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 
 from distractors_generator.generator import DistractorGenerator
 
@@ -34,21 +36,68 @@ def parse_args():
         default=1,
         help="Max. number of trials to deduplicate distractors",
     )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=20,
+        help="Max. number of concurrent requests to the OpenAI API",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch_size",
+        type=int,
+        default=10,
+        help="Number of words to pack into a single API request",
+    )
     parser.add_argument(
         "-o",
         "--output_path",
         type=Path,
-        default="distractors.json",
-        help="Path to the output JSON file",
+        default="distractors.jsonl",
+        help="Path to the output JSONL file",
     )
     return parser.parse_args()
 
 
-def generate_disctactors(
+async def _generate_for_chunk(
+    generator: DistractorGenerator,
+    semaphore: asyncio.Semaphore,
+    items: List[Dict[str, str]],
+    count: int,
+    deduplicate_trials: int,
+    output_file: TextIO,
+) -> float:
+    # Cap the number of in-flight requests to avoid hitting rate limits
+    async with semaphore:
+        start_time = time.time()  # Record the start time
+        responses = await generator.agenerate_batch(
+            items,
+            count=count,
+            deduplicate_num_trials=deduplicate_trials,
+        )
+        generation_time = time.time() - start_time
+
+    # Write results as soon as the chunk is done, so a crashed run keeps
+    # everything generated so far
+    for item, response in zip(items, responses):
+        output_item = {
+            "word": item["word"],
+            "translation": item["translation"],
+            "distractors": response,
+        }
+        output_file.write(orjson.dumps(output_item).decode() + "\n")
+
+    return generation_time
+
+
+async def generate_disctactors(
     input_path: Path,
     output_path: Path,
     count: int = 10,
     deduplicate_trials: int = 1,
+    concurrency: int = 20,
+    batch_size: int = 10,
 ) -> None:
     # Setup logging
     logging.basicConfig(level=logging.INFO)
@@ -62,49 +111,46 @@ def generate_disctactors(
 
     # Load the CSV file with word translations
     df = pd.read_csv(input_path)
-    # Keeping track of time taken to generate distractors
-    generation_times = []
-
-    # Create storage for outputs
-    outputs = []
-
-    # Iterate over the rows of the CSV file
-    for index in tqdm(range(len(df)), desc="Generating Distractors", unit="pair"):
-        # Parse the row
-        source_language = df.iloc[index]["source_language"]
-        target_language = df.iloc[index]["target_language"]
-        word = df.iloc[index]["word"]
-        translation = df.iloc[index]["translation"]
-        start_time = time.time()  # Record the start time
-        response = generator.generate(
-            word=word,
-            translation=translation,
-            source_language=source_language,
-            target_language=target_language,
-            count=count,
-            deduplicate_num_trials=deduplicate_trials,
-        )
-        generation_times.append(time.time() - start_time)
 
-        # Save the output to the JSONL file
-        output_item = {
-            "word": word,
-            "translation": translation,
-            "distractors": response,
-        }
-
-        # Append the current output to the existing JSONL file
-        outputs.append(output_item)
+    # Nothing to generate for a header-only CSV; still create the output file
+    if df.empty:
+        output_path.write_text("", encoding="utf-8")
+        logger.info(f"Saved distractors to {output_path}")
+        return
+
+    # Schedule one task per chunk of rows, throttled by the semaphore;
+    # each task appends its results to the line-buffered JSONL file as it
+    # finishes, so memory use stays flat and crashes don't lose progress
+    semaphore = asyncio.Semaphore(concurrency)
+    chunks = [df.iloc[i : i + batch_size] for i in range(0, len(df), batch_size)]
+    with output_path.open("w", encoding="utf-8", buffering=1) as output_file:
+        tasks = [
+            _generate_for_chunk(
+                generator=generator,
+                semaphore=semaphore,
+                items=[
+                    {
+                        "word": row.word,
+                        "translation": row.translation,
+                        "source_language": row.source_language,
+                        "target_language": row.target_language,
+                    }
+                    for row in chunk.itertuples(index=False)
+                ],
+                count=count,
+                deduplicate_trials=deduplicate_trials,
+                output_file=output_file,
+            )
+            for chunk in chunks
+        ]
+        generation_times = await tqdm_asyncio.gather(
+            *tasks, desc="Generating Distractors", unit="batch"
+        )
 
     # Log the average time taken to generate distractors
     generation_times = np.array(generation_times)
     logger.info(
-        f"Generation time: {generation_times.mean():.3f} ± {generation_times.std():.3f} sec."
-    )
-
-    # Dump to json file
-    output_path.write_text(
-        json.dumps(outputs, ensure_ascii=False, indent=4), encoding="utf-8"
+        f"Generation time per batch: {generation_times.mean():.3f} ± {generation_times.std():.3f} sec."
     )
 
     logger.info(f"Saved distractors to {output_path}")
@@ -112,11 +158,15 @@ def generate_disctactors(
 
 def main():
     args = parse_args()
-    generate_disctactors(
-        input_path=args.input_path,
-        output_path=args.output_path,
-        count=args.count,
-        deduplicate_trials=args.deduplicate_trials,
+    asyncio.run(
+        generate_disctactors(
+            input_path=args.input_path,
+            output_path=args.output_path,
+            count=args.count,
+            deduplicate_trials=args.deduplicate_trials,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+        )
     )
 
 
@@ -6,12 +6,12 @@ THIS_DIR = Path(__file__).parent
 
 
 def _load_requirements(path_dir: Path):
-    requirements_directory = path_dir / "requirements.txt"
-    requirements = []
-    with requirements_directory.open("r") as file:
-        for line in file.readlines():
-            requirements.append(line.lstrip())
-    return requirements
+    requirements_path = path_dir / "requirements.txt"
+    return [
+        line.strip()
+        for line in requirements_path.read_text().splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
 
 
 setup(